@@ -0,0 +1,34 @@
+"""
+Optional Numba-accelerated brightness/contrast kernel
+Used by the X-ray viewer for very large images; callers must fall back to
+the NumPy LUT path when Numba is not installed
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_bc_u8(arr, brightness, contrast, out):
+        """Fused out = clamp8(brightness * (127.5 + contrast * (v - 127.5)))
+
+        One parallel pass over the flat array; avoids the cast-up
+        temporaries NumPy materializes on multi-megapixel images.
+        """
+        flat_in = arr.ravel()
+        flat_out = out.ravel()
+        for i in prange(flat_in.size):
+            v = brightness * (127.5 + contrast * (flat_in[i] - 127.5))
+            if v < 0.0:
+                flat_out[i] = 0
+            elif v > 255.0:
+                flat_out[i] = 255
+            else:
+                flat_out[i] = np.uint8(v)
+else:
+    apply_bc_u8 = None
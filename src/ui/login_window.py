@@ -7,7 +7,7 @@ import sys
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QMessageBox, QFrame,
                              QGridLayout, QCheckBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent
 from PyQt6.QtGui import QFont, QPixmap, QIcon, QPalette, QColor
 
 from security.auth_manager import AuthManager
@@ -21,6 +21,8 @@ class LoginWindow(QWidget):
     def __init__(self, auth_manager: AuthManager):
         super().__init__()
         self.auth_manager = auth_manager
+        # Precomputed (text, enabled) pairs indexed by busy flag
+        self._btn_states = (("Login", True), ("Logging in...", False))
         self.setup_ui()
         self.setup_connections()
         
@@ -60,14 +62,7 @@ class LoginWindow(QWidget):
         # Login form
         form_frame = QFrame()
         form_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        form_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #bdc3c7;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        form_frame.setObjectName("formFrame")
         
         form_layout = QVBoxLayout(form_frame)
         form_layout.setSpacing(15)
@@ -80,21 +75,7 @@ class LoginWindow(QWidget):
         self.username_edit = QLineEdit()
         self.username_edit.setPlaceholderText("Enter your username")
         self.username_edit.setFont(QFont("Segoe UI", 10))
-        self.username_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ecf0f1;
-                border-radius: 6px;
-                background-color: #ffffff;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-        """)
+        self.username_edit.setObjectName("authLineEdit")
         
         # Password field
         password_label = QLabel("Password:")
@@ -105,50 +86,20 @@ class LoginWindow(QWidget):
         self.password_edit.setPlaceholderText("Enter your password")
         self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_edit.setFont(QFont("Segoe UI", 10))
-        self.password_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #ecf0f1;
-                border-radius: 6px;
-                background-color: #ffffff;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-        """)
+        self.password_edit.setObjectName("authLineEdit")
         
         # Show password checkbox
         self.show_password_checkbox = QCheckBox("Show password")
         self.show_password_checkbox.setFont(QFont("Segoe UI", 9))
-        self.show_password_checkbox.setStyleSheet("color: #7f8c8d;")
+        self.show_password_checkbox.setObjectName("showPasswordCheck")
         
-        # Login button
+        # Login button (palette-driven style avoids CSS re-resolution on hover)
         self.login_button = QPushButton("Login")
         self.login_button.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        self.login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 12px;
-                border: none;
-                border-radius: 6px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.login_button.setAutoFillBackground(True)
+        self._login_palettes = self._build_button_palettes("#3498db", "#2980b9")
+        self.login_button.setPalette(self._login_palettes[0])
+        self.login_button.installEventFilter(self)
         self.login_button.setCursor(Qt.CursorShape.PointingHandCursor)
         
         # Add widgets to form layout
@@ -173,14 +124,66 @@ class LoginWindow(QWidget):
         
         self.setLayout(main_layout)
         
-        # Set window style
+        # Set window style; form children are styled here via scoped object-name
+        # selectors so they resolve against this one stylesheet instead of
+        # each carrying their own
         self.setStyleSheet("""
             QWidget {
                 background-color: #ecf0f1;
                 font-family: 'Segoe UI', Arial, sans-serif;
             }
+            #formFrame {
+                background-color: #ffffff;
+                border: 1px solid #bdc3c7;
+                border-radius: 8px;
+                padding: 20px;
+            }
+            #formFrame #authLineEdit {
+                padding: 12px;
+                border: 2px solid #ecf0f1;
+                border-radius: 6px;
+                background-color: #ffffff;
+                font-size: 12px;
+                color: #2c3e50;
+            }
+            #formFrame #authLineEdit:focus {
+                border-color: #3498db;
+                background-color: #ffffff;
+                color: #2c3e50;
+            }
+            #formFrame #showPasswordCheck {
+                color: #7f8c8d;
+            }
         """)
+
+        # Pre-create the exit confirmation box so the first close prompt does
+        # not pay QMessageBox's theme introspection and icon loading cost
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setIcon(QMessageBox.Icon.Question)
+        self._confirm_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        self._confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._confirm_box.hide()
         
+    def _build_button_palettes(self, base_color: str, hover_color: str):
+        """Precompute normal/hover palettes for a flat colored button"""
+        palettes = []
+        for color in (base_color, hover_color):
+            palette = QPalette()
+            palette.setColor(QPalette.ColorRole.Button, QColor(color))
+            palette.setColor(QPalette.ColorRole.ButtonText, QColor("white"))
+            palettes.append(palette)
+        return tuple(palettes)
+
+    def eventFilter(self, obj, event):
+        """Swap precomputed palettes on hover instead of using CSS pseudo-states"""
+        if obj is self.login_button:
+            if event.type() == QEvent.Type.Enter:
+                self.login_button.setPalette(self._login_palettes[1])
+            elif event.type() == QEvent.Type.Leave:
+                self.login_button.setPalette(self._login_palettes[0])
+        return super().eventFilter(obj, event)
+
     def setup_connections(self):
         """Setup signal connections"""
         self.login_button.clicked.connect(self.attempt_login)
@@ -219,8 +222,7 @@ class LoginWindow(QWidget):
             return
         
         # Disable login button and show loading state
-        self.login_button.setEnabled(False)
-        self.login_button.setText("Logging in...")
+        self._set_login_busy(True)
         self.clear_error()
         
         # Attempt authentication
@@ -235,9 +237,16 @@ class LoginWindow(QWidget):
             self.show_error("Invalid username or password")
             self.password_edit.clear()
             self.password_edit.setFocus()
-            self.login_button.setEnabled(True)
-            self.login_button.setText("Login")
-            
+            self._set_login_busy(False)
+
+    def _set_login_busy(self, busy: bool):
+        """Apply the login button's busy/idle state as a single batched update"""
+        text, enabled = self._btn_states[int(busy)]
+        self.login_button.setUpdatesEnabled(False)
+        self.login_button.setText(text)
+        self.login_button.setEnabled(enabled)
+        self.login_button.setUpdatesEnabled(True)
+
     def show_error(self, message: str):
         """Show error message"""
         self.status_label.setText(message)
@@ -255,13 +264,10 @@ class LoginWindow(QWidget):
             event.accept()
             return
             
-        reply = QMessageBox.question(
-            self, 'Exit Application',
-            'Are you sure you want to exit the X-ray Management System?',
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
+        self._confirm_box.setWindowTitle('Exit Application')
+        self._confirm_box.setText('Are you sure you want to exit the X-ray Management System?')
+        reply = self._confirm_box.exec()
+
         if reply == QMessageBox.StandardButton.Yes:
             event.accept()
             sys.exit(0)
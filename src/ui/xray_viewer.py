@@ -1,492 +1,675 @@
-"""
-X-ray Viewer Widget
-Provides DICOM image viewing with annotation and measurement tools
-"""
-
-import os
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QSlider, QComboBox, QListWidget,
-                             QListWidgetItem, QSplitter, QFrame, QGroupBox,
-                             QScrollArea, QMessageBox, QFileDialog, QTextEdit)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPixmap, QPainter, QPen, QColor, QImage
-from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
-
-import pydicom
-import numpy as np
-from PIL import Image, ImageEnhance
-
-class XRayViewerWidget(QWidget):
-    """X-ray image viewer with DICOM support and annotation tools"""
-    
-    def __init__(self, db_manager, auth_manager):
-        super().__init__()
-        self.db_manager = db_manager
-        self.auth_manager = auth_manager
-        self.current_patient_id = None
-        self.current_image = None
-        self.dicom_data = None
-        self.zoom_factor = 1.0
-        self.brightness = 1.0
-        self.contrast = 1.0
-        
-        self.setup_ui()
-        self.setup_connections()
-        
-    def setup_ui(self):
-        """Setup the user interface"""
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(10)
-        
-        # Left panel - Image list and controls
-        left_panel = QFrame()
-        left_panel.setFrameStyle(QFrame.Shape.StyledPanel)
-        left_panel.setMaximumWidth(300)
-        left_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 6px;
-            }
-        """)
-        
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setSpacing(10)
-        
-        # Image list group
-        image_list_group = QGroupBox("Patient X-rays")
-        image_list_group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        image_list_layout = QVBoxLayout(image_list_group)
-        
-        self.image_list = QListWidget()
-        self.image_list.setFont(QFont("Segoe UI", 9))
-        self.image_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #bdc3c7;
-                background-color: white;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #ecf0f1;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-        """)
-        
-        image_list_layout.addWidget(self.image_list)
-        
-        # Import button
-        import_button = QPushButton("Import DICOM")
-        import_button.setFont(QFont("Segoe UI", 10))
-        import_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
-        
-        image_list_layout.addWidget(import_button)
-        
-        # Image controls group
-        controls_group = QGroupBox("Image Controls")
-        controls_group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        controls_layout = QVBoxLayout(controls_group)
-        
-        # Zoom control
-        zoom_label = QLabel("Zoom:")
-        zoom_label.setFont(QFont("Segoe UI", 9))
-        
-        self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
-        self.zoom_slider.setRange(25, 400)
-        self.zoom_slider.setValue(100)
-        self.zoom_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.zoom_slider.setTickInterval(25)
-        
-        self.zoom_value_label = QLabel("100%")
-        self.zoom_value_label.setFont(QFont("Segoe UI", 9))
-        self.zoom_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        zoom_layout = QHBoxLayout()
-        zoom_layout.addWidget(zoom_label)
-        zoom_layout.addWidget(self.zoom_slider)
-        zoom_layout.addWidget(self.zoom_value_label)
-        
-        # Brightness control
-        brightness_label = QLabel("Brightness:")
-        brightness_label.setFont(QFont("Segoe UI", 9))
-        
-        self.brightness_slider = QSlider(Qt.Orientation.Horizontal)
-        self.brightness_slider.setRange(0, 200)
-        self.brightness_slider.setValue(100)
-        
-        self.brightness_value_label = QLabel("100%")
-        self.brightness_value_label.setFont(QFont("Segoe UI", 9))
-        self.brightness_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        brightness_layout = QHBoxLayout()
-        brightness_layout.addWidget(brightness_label)
-        brightness_layout.addWidget(self.brightness_slider)
-        brightness_layout.addWidget(self.brightness_value_label)
-        
-        # Contrast control
-        contrast_label = QLabel("Contrast:")
-        contrast_label.setFont(QFont("Segoe UI", 9))
-        
-        self.contrast_slider = QSlider(Qt.Orientation.Horizontal)
-        self.contrast_slider.setRange(0, 200)
-        self.contrast_slider.setValue(100)
-        
-        self.contrast_value_label = QLabel("100%")
-        self.contrast_value_label.setFont(QFont("Segoe UI", 9))
-        self.contrast_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        contrast_layout = QHBoxLayout()
-        contrast_layout.addWidget(contrast_label)
-        contrast_layout.addWidget(self.contrast_slider)
-        contrast_layout.addWidget(self.contrast_value_label)
-        
-        # Reset button
-        reset_button = QPushButton("Reset View")
-        reset_button.setFont(QFont("Segoe UI", 9))
-        reset_button.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        
-        # Add controls to group
-        controls_layout.addLayout(zoom_layout)
-        controls_layout.addLayout(brightness_layout)
-        controls_layout.addLayout(contrast_layout)
-        controls_layout.addWidget(reset_button)
-        
-        # Position presets group
-        presets_group = QGroupBox("Position Presets")
-        presets_group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        presets_layout = QVBoxLayout(presets_group)
-        
-        self.position_combo = QComboBox()
-        self.position_combo.addItems([
-            "Chest AP", "Chest PA", "Chest Lateral",
-            "Spine AP", "Spine PA", "Spine Lateral",
-            "Abdomen AP", "Abdomen PA",
-            "Skull AP", "Skull PA", "Skull Lateral",
-            "Upper Limb", "Lower Limb"
-        ])
-        self.position_combo.setFont(QFont("Segoe UI", 9))
-        
-        presets_layout.addWidget(self.position_combo)
-        
-        # Add groups to left panel
-        left_layout.addWidget(image_list_group)
-        left_layout.addWidget(controls_group)
-        left_layout.addWidget(presets_group)
-        left_layout.addStretch()
-        
-        # Right panel - Image viewer
-        right_panel = QFrame()
-        right_panel.setFrameStyle(QFrame.Shape.StyledPanel)
-        right_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 6px;
-            }
-        """)
-        
-        right_layout = QVBoxLayout(right_panel)
-        
-        # Image viewer header
-        self.viewer_header = QLabel("No image selected")
-        self.viewer_header.setFont(QFont("Segoe UI", 12, QFont.Weight.Medium))
-        self.viewer_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.viewer_header.setStyleSheet("color: #7f8c8d; padding: 10px;")
-        
-        # Image viewer
-        self.image_view = QGraphicsView()
-        self.image_view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        self.image_view.setStyleSheet("border: 1px solid #bdc3c7; background-color: #2c3e50;")
-        
-        self.image_scene = QGraphicsScene()
-        self.image_view.setScene(self.image_scene)
-        
-        # Image info group
-        info_group = QGroupBox("Image Information")
-        info_group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        info_layout = QVBoxLayout(info_group)
-        
-        self.image_info_text = QTextEdit()
-        self.image_info_text.setReadOnly(True)
-        self.image_info_text.setMaximumHeight(100)
-        self.image_info_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: #f8f9fa;
-                font-family: 'Courier New', monospace;
-                font-size: 9px;
-            }
-        """)
-        
-        info_layout.addWidget(self.image_info_text)
-        
-        # Annotations group
-        annotations_group = QGroupBox("Annotations")
-        annotations_group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        annotations_layout = QVBoxLayout(annotations_group)
-        
-        self.annotations_text = QTextEdit()
-        self.annotations_text.setMaximumHeight(100)
-        self.annotations_text.setPlaceholderText("Enter annotations for this image...")
-        self.annotations_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
-        
-        save_annotations_button = QPushButton("Save Annotations")
-        save_annotations_button.setFont(QFont("Segoe UI", 9))
-        save_annotations_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        
-        annotations_layout.addWidget(self.annotations_text)
-        annotations_layout.addWidget(save_annotations_button)
-        
-        # Add to right panel
-        right_layout.addWidget(self.viewer_header)
-        right_layout.addWidget(self.image_view)
-        right_layout.addWidget(info_group)
-        right_layout.addWidget(annotations_group)
-        
-        # Add panels to main layout
-        main_layout.addWidget(left_panel)
-        main_layout.addWidget(right_panel)
-        
-    def setup_connections(self):
-        """Setup signal connections"""
-        self.image_list.itemSelectionChanged.connect(self.on_image_selected)
-        self.zoom_slider.valueChanged.connect(self.on_zoom_changed)
-        self.brightness_slider.valueChanged.connect(self.on_brightness_changed)
-        self.contrast_slider.valueChanged.connect(self.on_contrast_changed)
-        
-    def load_patient_xrays(self, patient_id):
-        """Load X-ray images for the specified patient"""
-        self.current_patient_id = patient_id
-        
-        if not patient_id:
-            self.image_list.clear()
-            return
-            
-        # Get patient X-rays from database
-        xrays = self.db_manager.get_patient_xrays(patient_id)
-        
-        # Populate image list
-        self.image_list.clear()
-        for xray in xrays:
-            item_text = f"{xray['body_part']} - {xray['position']} ({xray['acquisition_date']})"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, xray)
-            self.image_list.addItem(item)
-            
-    def on_image_selected(self):
-        """Handle image selection from list"""
-        current_item = self.image_list.currentItem()
-        if current_item:
-            xray_data = current_item.data(Qt.ItemDataRole.UserRole)
-            self.load_image(xray_data)
-            
-    def load_image(self, xray_data):
-        """Load and display the selected X-ray image"""
-        try:
-            image_path = xray_data['image_path']
-            
-            if not os.path.exists(image_path):
-                QMessageBox.warning(self, "File Not Found", 
-                                  f"Image file not found: {image_path}")
-                return
-                
-            # Try to load as DICOM first
-            try:
-                self.dicom_data = pydicom.dcmread(image_path)
-                self.display_dicom_image()
-            except:
-                # Fall back to regular image
-                self.display_regular_image(image_path)
-                
-            # Update header
-            self.viewer_header.setText(f"{xray_data['body_part']} - {xray_data['position']}")
-            
-            # Load annotations
-            self.annotations_text.setText(xray_data.get('annotations', ''))
-            
-            # Update image info
-            self.update_image_info(xray_data)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
-            
-    def display_dicom_image(self):
-        """Display DICOM image with proper windowing"""
-        if not self.dicom_data:
-            return
-            
-        # Get pixel data
-        pixel_array = self.dicom_data.pixel_array
-        
-        # Apply window/level if available
-        if hasattr(self.dicom_data, 'WindowCenter') and hasattr(self.dicom_data, 'WindowWidth'):
-            window_center = self.dicom_data.WindowCenter
-            window_width = self.dicom_data.WindowWidth
-            
-            # Apply windowing
-            min_val = window_center - window_width // 2
-            max_val = window_center + window_width // 2
-            pixel_array = np.clip(pixel_array, min_val, max_val)
-            
-        # Normalize to 0-255
-        pixel_array = ((pixel_array - pixel_array.min()) / 
-                      (pixel_array.max() - pixel_array.min()) * 255).astype(np.uint8)
-        
-        # Convert to PIL Image
-        pil_image = Image.fromarray(pixel_array)
-        
-        # Apply brightness and contrast
-        pil_image = self.apply_image_adjustments(pil_image)
-        
-        # Convert to QPixmap
-        qimage = self.pil_to_qimage(pil_image)
-        pixmap = QPixmap.fromImage(qimage)
-        
-        # Display in viewer
-        self.display_pixmap(pixmap)
-        
-    def display_regular_image(self, image_path):
-        """Display regular image file"""
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            QMessageBox.warning(self, "Error", "Failed to load image file")
-            return
-            
-        # Apply adjustments
-        pil_image = Image.open(image_path)
-        pil_image = self.apply_image_adjustments(pil_image)
-        
-        qimage = self.pil_to_qimage(pil_image)
-        pixmap = QPixmap.fromImage(qimage)
-        
-        self.display_pixmap(pixmap)
-        
-    def apply_image_adjustments(self, pil_image):
-        """Apply brightness and contrast adjustments"""
-        # Apply brightness
-        if self.brightness != 1.0:
-            enhancer = ImageEnhance.Brightness(pil_image)
-            pil_image = enhancer.enhance(self.brightness)
-            
-        # Apply contrast
-        if self.contrast != 1.0:
-            enhancer = ImageEnhance.Contrast(pil_image)
-            pil_image = enhancer.enhance(self.contrast)
-            
-        return pil_image
-        
-    def pil_to_qimage(self, pil_image):
-        """Convert PIL Image to QImage"""
-        if pil_image.mode == "RGB":
-            r, g, b = pil_image.split()
-            pil_image = Image.merge("RGB", (b, g, r))
-        elif pil_image.mode == "RGBA":
-            r, g, b, a = pil_image.split()
-            pil_image = Image.merge("RGBA", (b, g, r, a))
-        elif pil_image.mode == "L":
-            pil_image = pil_image.convert("RGBA")
-            
-        im_data = pil_image.tobytes("raw", pil_image.mode)
-        qim = QImage(im_data, pil_image.size[0], pil_image.size[1], 
-                    QImage.Format.Format_RGBA8888)
-        return qim
-        
-    def display_pixmap(self, pixmap):
-        """Display pixmap in the viewer"""
-        self.image_scene.clear()
-        
-        # Add pixmap to scene
-        pixmap_item = QGraphicsPixmapItem(pixmap)
-        self.image_scene.addItem(pixmap_item)
-        
-        # Fit to view
-        self.image_view.fitInView(pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
-        
-    def on_zoom_changed(self, value):
-        """Handle zoom slider change"""
-        self.zoom_factor = value / 100.0
-        self.zoom_value_label.setText(f"{value}%")
-        
-        if self.image_scene.items():
-            self.image_view.setTransform(self.image_view.transform().scale(self.zoom_factor, self.zoom_factor))
-            
-    def on_brightness_changed(self, value):
-        """Handle brightness slider change"""
-        self.brightness = value / 100.0
-        self.brightness_value_label.setText(f"{value}%")
-        
-        # Reload current image with new settings
-        current_item = self.image_list.currentItem()
-        if current_item:
-            xray_data = current_item.data(Qt.ItemDataRole.UserRole)
-            self.load_image(xray_data)
-            
-    def on_contrast_changed(self, value):
-        """Handle contrast slider change"""
-        self.contrast = value / 100.0
-        self.contrast_value_label.setText(f"{value}%")
-        
-        # Reload current image with new settings
-        current_item = self.image_list.currentItem()
-        if current_item:
-            xray_data = current_item.data(Qt.ItemDataRole.UserRole)
-            self.load_image(xray_data)
-            
-    def update_image_info(self, xray_data):
-        """Update image information display"""
-        info_text = f"Body Part: {xray_data['body_part']}\n"
-        info_text += f"Position: {xray_data['position']}\n"
-        info_text += f"Acquisition Date: {xray_data['acquisition_date']}\n"
-        info_text += f"Notes: {xray_data.get('notes', 'None')}\n"
-        
-        if self.dicom_data:
-            info_text += f"\nDICOM Info:\n"
-            info_text += f"Modality: {getattr(self.dicom_data, 'Modality', 'Unknown')}\n"
-            info_text += f"Manufacturer: {getattr(self.dicom_data, 'Manufacturer', 'Unknown')}\n"
-            info_text += f"Image Size: {getattr(self.dicom_data, 'Rows', 'Unknown')}x{getattr(self.dicom_data, 'Columns', 'Unknown')}\n"
-            
-        self.image_info_text.setText(info_text) 
\ No newline at end of file
+"""
+X-ray Viewer Widget
+Provides DICOM image viewing with annotation and measurement tools
+"""
+
+import os
+from functools import lru_cache
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+                             QPushButton, QSlider, QComboBox, QListWidget,
+                             QListWidgetItem, QSplitter, QFrame, QGroupBox,
+                             QScrollArea, QMessageBox, QFileDialog, QTextEdit)
+from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, QObject, QRunnable,
+                          QThreadPool)
+from PyQt6.QtGui import (QFont, QPixmap, QPainter, QPen, QColor, QImage,
+                         QTransform)
+from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
+
+# Shared fonts and stylesheet templates. Each QFont constructor hits the
+# font database and each setStyleSheet call parses CSS, so setup_ui reuses
+# these instead of rebuilding near-identical ones per widget.
+_FONT_SMALL = QFont("Segoe UI", 9)
+_FONT_BODY = QFont("Segoe UI", 10)
+_FONT_MEDIUM = QFont("Segoe UI", 10, QFont.Weight.Medium)
+_FONT_HEADER = QFont("Segoe UI", 12, QFont.Weight.Medium)
+
+_PANEL_QSS = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #bdc3c7;
+        border-radius: 6px;
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton {{
+        background-color: {base};
+        color: white;
+        border: none;
+        padding: {padding};
+        border-radius: 4px;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+
+_IMAGE_LIST_QSS = """
+    QListWidget {
+        border: 1px solid #bdc3c7;
+        background-color: white;
+    }
+    QListWidget::item {
+        padding: 8px;
+        border-bottom: 1px solid #ecf0f1;
+    }
+    QListWidget::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+"""
+
+_INFO_TEXT_QSS = """
+    QTextEdit {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        padding: 8px;
+        background-color: #f8f9fa;
+        font-family: 'Courier New', monospace;
+        font-size: 9px;
+    }
+"""
+
+_ANNOTATIONS_QSS = """
+    QTextEdit {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        padding: 8px;
+    }
+"""
+
+# Imaging libraries are imported on first use: pydicom alone adds several
+# hundred ms of cold start and none of them are needed until an image is
+# actually opened
+pydicom = None
+np = None
+Image = None
+_fast_enhance = None
+
+
+def _ensure_imaging_libs():
+    """Import pydicom/numpy/PIL the first time an image is loaded"""
+    global pydicom, np, Image, _fast_enhance
+    if pydicom is None:
+        import pydicom as _pydicom
+        import numpy as _np
+        from PIL import Image as _Image
+        from ui import _fast_enhance as _fe
+        pydicom = _pydicom
+        np = _np
+        Image = _Image
+        _fast_enhance = _fe
+
+
+@lru_cache(maxsize=4)
+def _cached_dcmread(path, mtime):
+    """dcmread memoized on (path, mtime) so flipping between the handful of
+    recently viewed studies skips the re-parse; mtime invalidates the entry
+    if the file changes on disk"""
+    return pydicom.dcmread(path)
+
+
+def _is_dicom(path):
+    """Check the DICM magic at offset 128 without parsing the file"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(128)
+            return f.read(4) == b'DICM'
+    except OSError:
+        return False
+
+
+def _window_to_uint8(arr, window_center, window_width):
+    """Map pixels through a window/level to uint8 with minimal temporaries"""
+    if arr.dtype.kind in ('i', 'u'):
+        # Integer data (12-bit CT etc.) has only width+1 distinct in-window
+        # values; index a small precomputed LUT instead of running float
+        # math over every pixel
+        width = int(window_width)
+        if 0 < width <= 65536:
+            lo_i = int(window_center) - width // 2
+            lut = (np.arange(width + 1) * (255.0 / width)).astype(np.uint8)
+            idx = np.clip(arr, lo_i, lo_i + width).astype(np.intp)
+            idx -= lo_i
+            return lut[idx]
+
+    lo = window_center - window_width // 2
+    # One float working buffer updated in place instead of a fresh array
+    # per clip/subtract/scale step
+    out = arr.astype(np.float32)
+    np.clip(out, lo, lo + window_width, out=out)
+    np.subtract(out, lo, out=out)
+    np.multiply(out, 255.0 / window_width, out=out)
+    return out.astype(np.uint8)
+
+
+def _dicom_to_uint8(dataset):
+    """Window and normalize a DICOM dataset's pixels to a uint8 array"""
+    pixel_array = dataset.pixel_array
+
+    # Apply window/level if available, else normalize over the pixel range
+    if hasattr(dataset, 'WindowCenter') and hasattr(dataset, 'WindowWidth'):
+        return _window_to_uint8(pixel_array, dataset.WindowCenter,
+                                dataset.WindowWidth)
+    min_val = pixel_array.min()
+    return _window_to_uint8(pixel_array,
+                            min_val + (pixel_array.max() - min_val) // 2,
+                            pixel_array.max() - min_val)
+
+
+class _LoaderSignals(QObject):
+    """Signal holder for DicomLoader (QRunnable cannot carry signals)"""
+    finished = pyqtSignal(int, object, object)  # seq, dataset, uint8 array
+    failed = pyqtSignal(int, str)  # seq, image path
+
+
+class DicomLoader(QRunnable):
+    """Reads, windows and normalizes a DICOM file off the GUI thread"""
+
+    def __init__(self, path, seq):
+        super().__init__()
+        self.path = path
+        self.seq = seq
+        self.signals = _LoaderSignals()
+
+    def run(self):
+        try:
+            dataset = _cached_dcmread(self.path, os.path.getmtime(self.path))
+            arr = _dicom_to_uint8(dataset)
+        except Exception:
+            # Not a DICOM (or unreadable as one); let the GUI thread fall
+            # back to regular image decoding
+            self.signals.failed.emit(self.seq, self.path)
+            return
+        self.signals.finished.emit(self.seq, dataset, arr)
+
+
+class XRayViewerWidget(QWidget):
+    """X-ray image viewer with DICOM support and annotation tools"""
+    
+    def __init__(self, db_manager, auth_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.auth_manager = auth_manager
+        self.current_patient_id = None
+        self.current_image = None
+        self.dicom_data = None
+        self._current_xray = None  # xray record for the current selection
+        self._source_u8 = None  # uint8 array actually displayed (may be decimated)
+        self._source_u8_full = None  # full-resolution decoded/windowed array
+        self._load_seq = 0  # discards background loads superseded by a newer selection
+        self._adjust_lut = None  # brightness/contrast LUT cached per slider values
+        self._adjust_lut_key = None
+        self.zoom_factor = 1.0
+        self.brightness = 1.0
+        self.contrast = 1.0
+        
+        self.setup_ui()
+        self.setup_connections()
+        
+    def setup_ui(self):
+        """Setup the user interface"""
+        main_layout = QHBoxLayout(self)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(10)
+        
+        # Left panel - Image list and controls
+        left_panel = QFrame()
+        left_panel.setFrameStyle(QFrame.Shape.StyledPanel)
+        left_panel.setMaximumWidth(300)
+        left_panel.setStyleSheet(_PANEL_QSS)
+        
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setSpacing(10)
+        
+        # Image list group
+        image_list_group = QGroupBox("Patient X-rays")
+        image_list_group.setFont(_FONT_MEDIUM)
+        image_list_layout = QVBoxLayout(image_list_group)
+        
+        self.image_list = QListWidget()
+        self.image_list.setFont(_FONT_SMALL)
+        self.image_list.setStyleSheet(_IMAGE_LIST_QSS)
+        
+        image_list_layout.addWidget(self.image_list)
+        
+        # Import button
+        import_button = QPushButton("Import DICOM")
+        import_button.setFont(_FONT_BODY)
+        import_button.setStyleSheet(_BUTTON_QSS.format(base="#27ae60", hover="#229954", padding="8px 16px"))
+        
+        image_list_layout.addWidget(import_button)
+        
+        # Image controls group
+        controls_group = QGroupBox("Image Controls")
+        controls_group.setFont(_FONT_MEDIUM)
+        controls_layout = QVBoxLayout(controls_group)
+        
+        # Zoom control
+        zoom_label = QLabel("Zoom:")
+        zoom_label.setFont(_FONT_SMALL)
+        
+        self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
+        self.zoom_slider.setRange(25, 400)
+        self.zoom_slider.setValue(100)
+        self.zoom_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        self.zoom_slider.setTickInterval(25)
+        
+        self.zoom_value_label = QLabel("100%")
+        self.zoom_value_label.setFont(_FONT_SMALL)
+        self.zoom_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        zoom_layout = QHBoxLayout()
+        zoom_layout.addWidget(zoom_label)
+        zoom_layout.addWidget(self.zoom_slider)
+        zoom_layout.addWidget(self.zoom_value_label)
+        
+        # Brightness control
+        brightness_label = QLabel("Brightness:")
+        brightness_label.setFont(_FONT_SMALL)
+        
+        self.brightness_slider = QSlider(Qt.Orientation.Horizontal)
+        self.brightness_slider.setRange(0, 200)
+        self.brightness_slider.setValue(100)
+        
+        self.brightness_value_label = QLabel("100%")
+        self.brightness_value_label.setFont(_FONT_SMALL)
+        self.brightness_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        brightness_layout = QHBoxLayout()
+        brightness_layout.addWidget(brightness_label)
+        brightness_layout.addWidget(self.brightness_slider)
+        brightness_layout.addWidget(self.brightness_value_label)
+        
+        # Contrast control
+        contrast_label = QLabel("Contrast:")
+        contrast_label.setFont(_FONT_SMALL)
+        
+        self.contrast_slider = QSlider(Qt.Orientation.Horizontal)
+        self.contrast_slider.setRange(0, 200)
+        self.contrast_slider.setValue(100)
+        
+        self.contrast_value_label = QLabel("100%")
+        self.contrast_value_label.setFont(_FONT_SMALL)
+        self.contrast_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        contrast_layout = QHBoxLayout()
+        contrast_layout.addWidget(contrast_label)
+        contrast_layout.addWidget(self.contrast_slider)
+        contrast_layout.addWidget(self.contrast_value_label)
+        
+        # Auto enhance button
+        self.auto_enhance_button = QPushButton("Auto Enhance")
+        self.auto_enhance_button.setFont(_FONT_SMALL)
+        self.auto_enhance_button.setStyleSheet(_BUTTON_QSS.format(base="#3498db", hover="#2980b9", padding="6px 12px"))
+
+        # Reset button
+        reset_button = QPushButton("Reset View")
+        reset_button.setFont(_FONT_SMALL)
+        reset_button.setStyleSheet(_BUTTON_QSS.format(base="#95a5a6", hover="#7f8c8d", padding="6px 12px"))
+        
+        # Add controls to group
+        controls_layout.addLayout(zoom_layout)
+        controls_layout.addLayout(brightness_layout)
+        controls_layout.addLayout(contrast_layout)
+        controls_layout.addWidget(self.auto_enhance_button)
+        controls_layout.addWidget(reset_button)
+        
+        # Position presets group
+        presets_group = QGroupBox("Position Presets")
+        presets_group.setFont(_FONT_MEDIUM)
+        presets_layout = QVBoxLayout(presets_group)
+        
+        self.position_combo = QComboBox()
+        self.position_combo.addItems([
+            "Chest AP", "Chest PA", "Chest Lateral",
+            "Spine AP", "Spine PA", "Spine Lateral",
+            "Abdomen AP", "Abdomen PA",
+            "Skull AP", "Skull PA", "Skull Lateral",
+            "Upper Limb", "Lower Limb"
+        ])
+        self.position_combo.setFont(_FONT_SMALL)
+        
+        presets_layout.addWidget(self.position_combo)
+        
+        # Add groups to left panel
+        left_layout.addWidget(image_list_group)
+        left_layout.addWidget(controls_group)
+        left_layout.addWidget(presets_group)
+        left_layout.addStretch()
+        
+        # Right panel - Image viewer
+        right_panel = QFrame()
+        right_panel.setFrameStyle(QFrame.Shape.StyledPanel)
+        right_panel.setStyleSheet(_PANEL_QSS)
+        
+        right_layout = QVBoxLayout(right_panel)
+        
+        # Image viewer header
+        self.viewer_header = QLabel("No image selected")
+        self.viewer_header.setFont(_FONT_HEADER)
+        self.viewer_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.viewer_header.setStyleSheet("color: #7f8c8d; padding: 10px;")
+        
+        # Image viewer
+        self.image_view = QGraphicsView()
+        self.image_view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.image_view.setStyleSheet("border: 1px solid #bdc3c7; background-color: #2c3e50;")
+        
+        self.image_scene = QGraphicsScene()
+        self.image_view.setScene(self.image_scene)
+        
+        # Image info group
+        info_group = QGroupBox("Image Information")
+        info_group.setFont(_FONT_MEDIUM)
+        info_layout = QVBoxLayout(info_group)
+        
+        self.image_info_text = QTextEdit()
+        self.image_info_text.setReadOnly(True)
+        self.image_info_text.setMaximumHeight(100)
+        self.image_info_text.setStyleSheet(_INFO_TEXT_QSS)
+        
+        info_layout.addWidget(self.image_info_text)
+        
+        # Annotations group
+        annotations_group = QGroupBox("Annotations")
+        annotations_group.setFont(_FONT_MEDIUM)
+        annotations_layout = QVBoxLayout(annotations_group)
+        
+        self.annotations_text = QTextEdit()
+        self.annotations_text.setMaximumHeight(100)
+        self.annotations_text.setPlaceholderText("Enter annotations for this image...")
+        self.annotations_text.setStyleSheet(_ANNOTATIONS_QSS)
+        
+        save_annotations_button = QPushButton("Save Annotations")
+        save_annotations_button.setFont(_FONT_SMALL)
+        save_annotations_button.setStyleSheet(_BUTTON_QSS.format(base="#3498db", hover="#2980b9", padding="6px 12px"))
+        
+        annotations_layout.addWidget(self.annotations_text)
+        annotations_layout.addWidget(save_annotations_button)
+        
+        # Add to right panel
+        right_layout.addWidget(self.viewer_header)
+        right_layout.addWidget(self.image_view)
+        right_layout.addWidget(info_group)
+        right_layout.addWidget(annotations_group)
+        
+        # Add panels to main layout
+        main_layout.addWidget(left_panel)
+        main_layout.addWidget(right_panel)
+        
+    def setup_connections(self):
+        """Setup signal connections"""
+        # valueChanged fires for every pixel of slider travel; coalesce
+        # bursts into at most one refresh per frame (~16 ms)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh_display)
+
+        self.image_list.itemSelectionChanged.connect(self.on_image_selected)
+        self.auto_enhance_button.clicked.connect(self.auto_enhance)
+        self.zoom_slider.valueChanged.connect(self.on_zoom_changed)
+        self.brightness_slider.valueChanged.connect(self.on_brightness_changed)
+        self.contrast_slider.valueChanged.connect(self.on_contrast_changed)
+        
+    def load_patient_xrays(self, patient_id):
+        """Load X-ray images for the specified patient"""
+        self.current_patient_id = patient_id
+        self._source_u8 = None
+        self._source_u8_full = None
+
+        if not patient_id:
+            self.image_list.clear()
+            return
+            
+        # Get patient X-rays from database
+        xrays = self.db_manager.get_patient_xrays(patient_id)
+
+        # Populate image list with repaints and per-item signals suspended
+        # so the rebuild costs one update instead of one per row
+        self.image_list.setUpdatesEnabled(False)
+        self.image_list.blockSignals(True)
+        try:
+            self.image_list.clear()
+            for xray in xrays:
+                item_text = f"{xray['body_part']} - {xray['position']} ({xray['acquisition_date']})"
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.ItemDataRole.UserRole, xray)
+                self.image_list.addItem(item)
+        finally:
+            self.image_list.blockSignals(False)
+            self.image_list.setUpdatesEnabled(True)
+            
+    def on_image_selected(self):
+        """Handle image selection from list"""
+        current_item = self.image_list.currentItem()
+        if current_item:
+            # Keep the record on the widget; later handlers read this field
+            # instead of going back through the Qt item/UserRole bridge
+            self._current_xray = current_item.data(Qt.ItemDataRole.UserRole)
+            self._source_u8 = None
+            self._source_u8_full = None
+            self.load_image(self._current_xray)
+            
+    def load_image(self, xray_data):
+        """Load and display the selected X-ray image"""
+        _ensure_imaging_libs()
+        try:
+            image_path = xray_data['image_path']
+            
+            if not os.path.exists(image_path):
+                QMessageBox.warning(self, "File Not Found", 
+                                  f"Image file not found: {image_path}")
+                return
+                
+            self.dicom_data = None
+            self._current_xray = xray_data
+            self._load_seq += 1
+            if _is_dicom(image_path):
+                # Decode and window off the GUI thread; _on_dicom_ready
+                # does the Qt-side pixmap work once the worker finishes
+                loader = DicomLoader(image_path, self._load_seq)
+                loader.signals.finished.connect(self._on_dicom_ready)
+                loader.signals.failed.connect(self._on_dicom_failed)
+                QThreadPool.globalInstance().start(loader)
+            else:
+                # An 8-byte sniff routes non-DICOM files straight to the
+                # regular decoder; previously pydicom parsed (and failed
+                # on) the whole file first
+                self.display_regular_image(image_path)
+
+            # Update header
+            self.viewer_header.setText(f"{xray_data['body_part']} - {xray_data['position']}")
+            
+            # Load annotations
+            self.annotations_text.setText(xray_data.get('annotations', ''))
+            
+            # Update image info
+            self.update_image_info(xray_data)
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
+            
+    def _on_dicom_ready(self, seq, dataset, pixel_array):
+        """Display a decoded DICOM once its background load finishes"""
+        if seq != self._load_seq:
+            return  # a newer selection superseded this load
+
+        self.dicom_data = dataset
+        # Cache the windowed source so slider changes only re-run the
+        # LUT + blit step instead of re-reading and re-windowing the file
+        self._set_source(pixel_array)
+        self._refresh_display()
+        # Re-render the info pane now that DICOM metadata is available
+        self.update_image_info(self._current_xray)
+
+    def _on_dicom_failed(self, seq, image_path):
+        """Fall back to regular image decoding when the file is not DICOM"""
+        if seq != self._load_seq:
+            return
+        self.display_regular_image(image_path)
+        
+    def display_regular_image(self, image_path):
+        """Display regular image file"""
+        # Decode exactly once; the old path decoded through QPixmap and
+        # then again through PIL just to apply adjustments
+        try:
+            arr = np.array(Image.open(image_path))
+        except (OSError, ValueError):
+            QMessageBox.warning(self, "Error", "Failed to load image file")
+            return
+
+        self._set_source(arr)
+        self._refresh_display()
+
+    def _set_source(self, arr):
+        """Cache the full-resolution source and derive the display copy"""
+        self._source_u8_full = arr
+        self._source_u8 = self._decimate_for_viewport(arr)
+
+    def _decimate_for_viewport(self, arr):
+        """Skip-sample huge arrays toward viewport resolution when zoomed out
+
+        A 4096x4096 slice blitted into an ~800px viewport moves 16x the
+        bytes the screen can show; above 1:1 zoom the full array is kept so
+        detail is never lost while inspecting.
+        """
+        if self.zoom_factor > 1.0:
+            return arr
+
+        viewport = self.image_view.viewport()
+        target = 2 * max(viewport.width(), viewport.height(), 1)
+        step = max(arr.shape[0], arr.shape[1]) // target
+        if step > 1:
+            return arr[::step, ::step]
+        return arr
+
+    def auto_enhance(self):
+        """Equalize the displayed image through a histogram-CDF lookup table"""
+        if self._source_u8_full is None:
+            return
+
+        hist = np.bincount(self._source_u8_full.ravel(), minlength=256)
+        cdf = hist.cumsum()
+        lut = np.around(cdf * (255.0 / cdf[-1])).astype(np.uint8)
+        # Store the equalized pixels as the new source so the brightness
+        # and contrast sliders compose on top of it
+        self._set_source(lut[self._source_u8_full])
+        self._refresh_display()
+
+    def _refresh_display(self):
+        """Re-apply adjustments to the cached source array and redisplay"""
+        if self._source_u8 is None:
+            return
+
+        arr = self.apply_adjustments_ndarray(self._source_u8)
+        self.display_pixmap(QPixmap.fromImage(self._ndarray_to_qimage(arr)))
+        
+    def apply_adjustments_ndarray(self, arr):
+        """Apply brightness and contrast adjustments to a uint8 ndarray"""
+        if self.brightness == 1.0 and self.contrast == 1.0:
+            return arr
+
+        # Very large images are memory-bound through the LUT gather; use
+        # the parallel Numba kernel when it is available
+        if _fast_enhance.HAVE_NUMBA and arr.size > 1_000_000:
+            src = np.ascontiguousarray(arr)
+            out = np.empty_like(src)
+            _fast_enhance.apply_bc_u8(src, self.brightness, self.contrast, out)
+            return out
+
+        # Fuse both adjustments into one 256-entry lookup table
+        # (out = brightness * (127.5 + contrast * (in - 127.5))) applied in a
+        # single pass, instead of two ImageEnhance passes that each allocate
+        # and walk a full temporary image. The table is cached against the
+        # slider values so repeated refreshes at the same settings skip the
+        # rebuild
+        key = (self.brightness, self.contrast)
+        if self._adjust_lut_key != key:
+            idx = np.arange(256, dtype=np.float32)
+            self._adjust_lut = np.clip(
+                self.brightness * (127.5 + self.contrast * (idx - 127.5)),
+                0, 255).astype(np.uint8)
+            self._adjust_lut_key = key
+        return self._adjust_lut[arr]
+        
+    def _ndarray_to_qimage(self, arr):
+        """Wrap a uint8 ndarray in a QImage without copying the pixels"""
+        arr = np.ascontiguousarray(arr)
+        # QImage only views the buffer; keep the array alive until the
+        # next refresh replaces it
+        self._display_arr = arr
+
+        height, width = arr.shape[:2]
+        if arr.ndim == 2:
+            fmt = QImage.Format.Format_Grayscale8
+        elif arr.shape[2] == 3:
+            fmt = QImage.Format.Format_RGB888
+        else:
+            fmt = QImage.Format.Format_RGBA8888
+        return QImage(arr.data, width, height, arr.strides[0], fmt)
+        
+    def display_pixmap(self, pixmap):
+        """Display pixmap in the viewer"""
+        self.image_scene.clear()
+        
+        # Add pixmap to scene
+        pixmap_item = QGraphicsPixmapItem(pixmap)
+        self.image_scene.addItem(pixmap_item)
+        
+        # Fit to view
+        self.image_view.fitInView(pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+        
+    def on_zoom_changed(self, value):
+        """Handle zoom slider change"""
+        self.zoom_factor = value / 100.0
+        self.zoom_value_label.setText(f"{value}%")
+
+        # Build the transform from the absolute slider value; compounding
+        # the current transform made zoom accelerate exponentially per tick
+        transform = QTransform()
+        transform.scale(self.zoom_factor, self.zoom_factor)
+        self.image_view.setTransform(transform)
+
+        # Re-derive the display copy: zooming past 1:1 needs the
+        # full-resolution source, zooming back out can drop to the
+        # decimated one
+        if self._source_u8_full is not None:
+            arr = self._decimate_for_viewport(self._source_u8_full)
+            if self._source_u8 is None or arr.shape != self._source_u8.shape:
+                self._source_u8 = arr
+                self._refresh_timer.start()
+            
+    def on_brightness_changed(self, value):
+        """Handle brightness slider change"""
+        self.brightness = value / 100.0
+        self.brightness_value_label.setText(f"{value}%")
+        self._refresh_timer.start()
+
+    def on_contrast_changed(self, value):
+        """Handle contrast slider change"""
+        self.contrast = value / 100.0
+        self.contrast_value_label.setText(f"{value}%")
+        self._refresh_timer.start()
+            
+    def update_image_info(self, xray_data):
+        """Update image information display"""
+        lines = [
+            f"Body Part: {xray_data['body_part']}",
+            f"Position: {xray_data['position']}",
+            f"Acquisition Date: {xray_data['acquisition_date']}",
+            f"Notes: {xray_data.get('notes', 'None')}",
+        ]
+
+        if self.dicom_data:
+            lines += [
+                "",
+                "DICOM Info:",
+                f"Modality: {getattr(self.dicom_data, 'Modality', 'Unknown')}",
+                f"Manufacturer: {getattr(self.dicom_data, 'Manufacturer', 'Unknown')}",
+                f"Image Size: {getattr(self.dicom_data, 'Rows', 'Unknown')}x{getattr(self.dicom_data, 'Columns', 'Unknown')}",
+            ]
+
+        self.image_info_text.setText("\n".join(lines))
\ No newline at end of file
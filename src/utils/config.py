@@ -5,14 +5,29 @@ Manages application settings and configuration
 
 import json
 import os
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 
 class Config:
     """Configuration manager for the application"""
-    
+
     def __init__(self, config_file: str = "config/settings.json"):
         self.config_file = config_file
+        self._dirty = False
+        self._batch_depth = 0
         self.config_data = self.load_config()
+        self._flat = self._flatten(self.config_data)
+
+    def _flatten(self, tree: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Build a flat dotted-key index over a nested config dict"""
+        flat = {}
+        for key, value in tree.items():
+            full_key = prefix + key
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, full_key + "."))
+            else:
+                flat[full_key] = value
+        return flat
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -85,18 +100,44 @@ class Config:
         """Save configuration to file"""
         if config_data is None:
             config_data = self.config_data
-            
+
         try:
-            with open(self.config_file, 'w') as f:
+            # Write to a temp file and os.replace so a crash mid-write can
+            # never leave a truncated settings file behind
+            tmp_path = self.config_file + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(config_data, f, indent=4)
+            os.replace(tmp_path, self.config_file)
         except Exception as e:
             print(f"Error saving config: {e}")
+        self._dirty = False
+
+    def flush(self):
+        """Write pending changes to disk, if any"""
+        if self._dirty:
+            self.save_config()
+
+    @contextmanager
+    def batch(self):
+        """Defer saving while several values are set, then write once"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key (supports dot notation)"""
+        # Leaf values resolve with one hash lookup; the split-and-walk path
+        # below only remains for reads of whole subtrees
+        if key in self._flat:
+            return self._flat[key]
+
         keys = key.split('.')
         value = self.config_data
-        
+
         try:
             for k in keys:
                 value = value[k]
@@ -115,11 +156,20 @@ class Config:
                 config[k] = {}
             config = config[k]
         
-        # Set the value
+        # Set the value. Rebuild the index when a dict is written or
+        # overwritten: a scalar replacing a subtree must also drop the
+        # subtree's old leaf keys from _flat
+        previous = config.get(keys[-1])
         config[keys[-1]] = value
-        
-        # Save to file
-        self.save_config()
+        if isinstance(value, dict) or isinstance(previous, dict):
+            self._flat = self._flatten(self.config_data)
+        else:
+            self._flat[key] = value
+        self._dirty = True
+
+        # Save now unless a batch() block is deferring the write
+        if self._batch_depth == 0:
+            self.flush()
     
     def get_database_path(self) -> str:
         """Get database file path"""
@@ -172,29 +222,32 @@ class Config:
     def update_database_settings(self, path: str = None, backup_enabled: bool = None, 
                                backup_interval: int = None):
         """Update database configuration"""
-        if path:
-            self.set("database.path", path)
-        if backup_enabled is not None:
-            self.set("database.backup_enabled", backup_enabled)
-        if backup_interval:
-            self.set("database.backup_interval_hours", backup_interval)
+        with self.batch():
+            if path:
+                self.set("database.path", path)
+            if backup_enabled is not None:
+                self.set("database.backup_enabled", backup_enabled)
+            if backup_interval:
+                self.set("database.backup_interval_hours", backup_interval)
     
     def update_security_settings(self, session_timeout: int = None, 
                                max_attempts: int = None, min_password_length: int = None):
         """Update security configuration"""
-        if session_timeout:
-            self.set("security.session_timeout_minutes", session_timeout)
-        if max_attempts:
-            self.set("security.max_login_attempts", max_attempts)
-        if min_password_length:
-            self.set("security.password_min_length", min_password_length)
+        with self.batch():
+            if session_timeout:
+                self.set("security.session_timeout_minutes", session_timeout)
+            if max_attempts:
+                self.set("security.max_login_attempts", max_attempts)
+            if min_password_length:
+                self.set("security.password_min_length", min_password_length)
     
     def update_ui_settings(self, theme: str = None, language: str = None):
         """Update UI configuration"""
-        if theme:
-            self.set("ui.theme", theme)
-        if language:
-            self.set("ui.language", language)
+        with self.batch():
+            if theme:
+                self.set("ui.theme", theme)
+            if language:
+                self.set("ui.language", language)
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
@@ -232,4 +285,5 @@ class Config:
         }
         
         self.config_data = default_config
-        self.save_config() 
\ No newline at end of file
+        self._flat = self._flatten(self.config_data)
+        self.save_config()
\ No newline at end of file